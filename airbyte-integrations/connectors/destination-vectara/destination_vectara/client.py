@@ -2,18 +2,36 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
 import json
+import threading
+import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Mapping
 
 import backoff
+import orjson
 import requests
 from destination_vectara.config import VectaraConfig
+from requests.adapters import HTTPAdapter
 
 METADATA_STREAM_FIELD = "_ab_stream"
 
+# Metadata values of these types are sent as-is, everything else is JSON encoded
+_PRIMITIVE_METADATA_TYPES = (str, int, float, bool)
+_PRIMITIVE_METADATA_TYPE_SET = frozenset(_PRIMITIVE_METADATA_TYPES)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 encoded JSON with orjson.
+    Falls back to the standard library for values orjson rejects, e.g. integers that don't fit in 64 bits.
+    """
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 def user_error(e: Exception) -> bool:
     """
@@ -27,6 +45,11 @@ def user_error(e: Exception) -> bool:
 class VectaraClient:
 
     BASE_URL = "https://api.vectara.io/v1"
+    MAX_PARALLEL_REQUESTS = 8
+    MAX_PARALLEL_DELETES = 16
+    QUERY_PAGE_SIZE = 100
+    # Renew the JWT token this many seconds before it expires
+    JWT_TOKEN_REFRESH_MARGIN_SECONDS = 60
 
     def __init__(self, config: VectaraConfig):
         if isinstance(config, dict):
@@ -36,8 +59,24 @@ class VectaraClient:
         self.client_id = config.oauth2.client_id
         self.client_secret = config.oauth2.client_secret
         self.parallelize = config.parallelize
+        self._jwt_token_lock = threading.Lock()
+        self._jwt_token_refresh_at = 0.0
+        self._session = self._create_session()
         self.check()
 
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session which keeps connections to Vectara alive between requests.
+        The pool is sized so that parallel indexing threads don't have to wait for a free connection.
+        """
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+        return session
+
+    def close(self):
+        """Release the pooled connections."""
+        self._session.close()
+
     def check(self):
         """
         Check for an existing corpus in Vectara.
@@ -89,22 +128,29 @@ class VectaraClient:
         }
         data = {"grant_type": "client_credentials", "client_id": self.client_id, "client_secret": self.client_secret}
 
-        request_time = datetime.datetime.now().timestamp()
+        request_time = time.monotonic()
+        # The token endpoint is on another host, so it is called outside of the Vectara session.
         response = requests.request(method="POST", url=token_endpoint, headers=headers, data=data)
         response_json = response.json()
 
         self.jwt_token = response_json.get("access_token")
-        self.jwt_token_expires_ts = request_time + response_json.get("expires_in")
+        self._jwt_token_refresh_at = request_time + response_json.get("expires_in") - self.JWT_TOKEN_REFRESH_MARGIN_SECONDS
         return self.jwt_token
 
+    def _ensure_fresh_jwt_token(self):
+        """Renew the JWT token if it is about to expire. Only one thread renews it, the others wait for the new token."""
+        if time.monotonic() < self._jwt_token_refresh_at:
+            return
+        with self._jwt_token_lock:
+            if time.monotonic() >= self._jwt_token_refresh_at:
+                self._get_jwt_token()
+
     @backoff.on_exception(backoff.expo, requests.exceptions.RequestException, max_tries=5, giveup=user_error)
     def _request(self, endpoint: str, http_method: str = "POST", params: Mapping[str, Any] = None, data: Mapping[str, Any] = None):
 
         url = f"{self.BASE_URL}/{endpoint}"
 
-        current_ts = datetime.datetime.now().timestamp()
-        if self.jwt_token_expires_ts - current_ts <= 60:
-            self._get_jwt_token()
+        self._ensure_fresh_jwt_token()
 
         headers = {
             "Content-Type": "application/json",
@@ -114,37 +160,61 @@ class VectaraClient:
             "X-source": "airbyte",
         }
 
-        response = requests.request(method=http_method, url=url, headers=headers, params=params, data=json.dumps(data))
+        body = None if data is None else _json_dumps(data)
+        response = self._session.request(method=http_method, url=url, headers=headers, params=params, data=body)
         response.raise_for_status()
         return response.json()
 
     def delete_doc_by_metadata(self, metadata_field_name, metadata_field_values):
         document_ids = []
         for value in metadata_field_values:
+            document_ids.extend(self._iter_doc_ids_by_metadata(metadata_field_name, value))
+        # All pages are read before deleting anything, otherwise the deletes would shift the query offsets and skip documents.
+        # A document with several sections can show up on more than one page, so duplicates are dropped.
+        self.delete_docs_by_id(document_ids=list(dict.fromkeys(document_ids)))
+
+    def _iter_doc_ids_by_metadata(self, metadata_field_name, metadata_field_value):
+        """
+        Page through the query results for the given metadata filter and yield the ids of the matching documents.
+        The query returns matching sections, so a page with fewer sections than the page size is the last one.
+        """
+        start = 0
+        while True:
             data = {
                 "query": [
                     {
                         "query": "",
-                        "numResults": 100,
+                        "start": start,
+                        "numResults": self.QUERY_PAGE_SIZE,
                         "corpusKey": [
                             {
                                 "customerId": self.customer_id,
                                 "corpusId": self.corpus_id,
-                                "metadataFilter": f"doc.{metadata_field_name} = '{value}'",
+                                "metadataFilter": f"doc.{metadata_field_name} = '{metadata_field_value}'",
                             }
                         ],
                     }
                 ]
             }
-            query_documents_response = self._request(endpoint="query", data=data)
-            document_ids.extend([document.get("id") for document in query_documents_response.get("responseSet")[0].get("document")])
-        self.delete_docs_by_id(document_ids=document_ids)
+            response_set = self._request(endpoint="query", data=data).get("responseSet")[0]
+            yield from (document.get("id") for document in response_set.get("document", []))
+            if len(response_set.get("response", [])) < self.QUERY_PAGE_SIZE:
+                return
+            start += self.QUERY_PAGE_SIZE
 
     def delete_docs_by_id(self, document_ids):
-        for document_id in document_ids:
-            self._request(
-                endpoint="delete-doc", data={"customerId": self.customer_id, "corpusId": self.corpus_id, "documentId": document_id}
-            )
+        if self.parallelize:
+            # Deletes are independent of each other, so they are sent concurrently. Consuming the results re-raises the first failure.
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_DELETES) as executor:
+                list(executor.map(self._delete_doc_by_id, document_ids))
+        else:
+            for document_id in document_ids:
+                self._delete_doc_by_id(document_id)
+
+    def _delete_doc_by_id(self, document_id):
+        return self._request(
+            endpoint="delete-doc", data={"customerId": self.customer_id, "corpusId": self.corpus_id, "documentId": document_id}
+        )
 
     def index_document(self, document):
         document_section, document_metadata, document_title, document_id = document
@@ -156,7 +226,7 @@ class VectaraClient:
             "corpusId": self.corpus_id,
             "document": {
                 "documentId": document_id,
-                "metadataJson": json.dumps(document_metadata),
+                "metadataJson": _json_dumps(document_metadata).decode(),
                 "title": document_title,
                 "section": [
                     {"text": f"{section_key}: {section_value}"}
@@ -170,7 +240,7 @@ class VectaraClient:
 
     def index_documents(self, documents):
         if self.parallelize:
-            with ThreadPoolExecutor() as executor:
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
                 futures = [executor.submit(self.index_document, doc) for doc in documents]
                 for future in futures:
                     try:
@@ -189,11 +259,10 @@ class VectaraClient:
                 self.index_document(doc)
 
     def _normalize(self, metadata: dict) -> dict:
-        result = {}
-        for key, value in metadata.items():
-            if isinstance(value, (str, int, float, bool)):
-                result[key] = value
-            else:
-                # JSON encode all other types
-                result[key] = json.dumps(value)
-        return result
+        # The exact type lookup covers almost every value, isinstance is only needed for subclasses of the primitive types
+        return {
+            key: value
+            if type(value) in _PRIMITIVE_METADATA_TYPE_SET or isinstance(value, _PRIMITIVE_METADATA_TYPES)
+            else _json_dumps(value).decode()
+            for key, value in metadata.items()
+        }
@@ -41,31 +41,35 @@ class DestinationVectara(Destination):
         """
 
         config_model = VectaraConfig.parse_obj(config)
+        client = VectaraClient(config_model)
         writer = VectaraWriter(
-            client=VectaraClient(config_model),
+            client=client,
             text_fields=config_model.text_fields,
             title_field=config_model.title_field,
             metadata_fields=config_model.metadata_fields,
             catalog=configured_catalog,
         )
 
-        writer.delete_streams_to_overwrite(catalog=configured_catalog)
+        try:
+            writer.delete_streams_to_overwrite(catalog=configured_catalog)
 
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                writer.flush()
-                yield message
-            elif message.type == Type.RECORD:
-                record = message.record
-                writer.queue_write_operation(record)
-            else:
-                # ignore other message types for now
-                continue
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
+                    # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
+                    writer.flush()
+                    yield message
+                elif message.type == Type.RECORD:
+                    record = message.record
+                    writer.queue_write_operation(record)
+                else:
+                    # ignore other message types for now
+                    continue
 
-        # Make sure to flush any records still in the queue
-        writer.flush()
+            # Make sure to flush any records still in the queue
+            writer.flush()
+        finally:
+            client.close()
 
     def check(self, logger: AirbyteLogger, config: VectaraConfig) -> AirbyteConnectionStatus:
         """
@@ -81,6 +85,7 @@ class DestinationVectara(Destination):
         """
         client = VectaraClient(config=config)
         client_error = client.check()
+        client.close()
         if client_error:
             return AirbyteConnectionStatus(status=Status.FAILED, message="\n".join([client_error]))
         else:
@@ -3,7 +3,7 @@
 #
 
 import uuid
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import dpath.util
 from airbyte_cdk.models import AirbyteRecordMessage, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode
@@ -16,7 +16,6 @@ METADATA_STREAM_FIELD = "_ab_stream"
 
 class VectaraWriter:
 
-    write_buffer: List[Mapping[str, Any]] = []
     flush_interval = 1000
 
     def __init__(
@@ -33,6 +32,7 @@ class VectaraWriter:
         self.metadata_fields = metadata_fields
         self.streams = {f"{stream.stream.namespace}_{stream.stream.name}": stream for stream in catalog.streams}
         self.ids_to_delete: List[str] = []
+        self.write_buffer: List[Tuple[Dict[str, Any], Dict[str, Any], str, str]] = []
 
     def delete_streams_to_overwrite(self, catalog: ConfiguredAirbyteCatalog) -> None:
         streams_to_overwrite = [
@@ -61,14 +61,16 @@ class VectaraWriter:
             if self.streams[stream_identifier].destination_sync_mode == DestinationSyncMode.append_dedup:
                 self.ids_to_delete.append(document_id)
         else:
-            document_id = str(uuid.uuid4().int)
+            document_id = uuid.uuid4().hex
 
         self.write_buffer.append((document_section, document_metadata, document_title, document_id))
-        if len(self.write_buffer) == self.flush_interval:
+        if len(self.write_buffer) >= self.flush_interval:
             self.flush()
 
     def flush(self) -> None:
         """Flush all documents in Queue to Vectara"""
+        if not self.write_buffer:
+            return
         self._delete_documents_to_dedupe()
         self.client.index_documents(self.write_buffer)
         self.write_buffer.clear()
@@ -7,6 +7,7 @@ from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
     "airbyte-cdk==0.57.8",
+    "orjson~=3.9",
 ]
 
 TEST_REQUIREMENTS = ["pytest~=6.2"]
@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Mapping
+from unittest.mock import MagicMock, patch
+
+import pytest
+from destination_vectara.client import VectaraClient
+
+PAGE_SIZE = 2
+
+
+@pytest.fixture(name="client")
+def client_fixture() -> VectaraClient:
+    config = {
+        "oauth2": {"client_id": "client-id", "client_secret": "client-secret"},
+        "customer_id": "123456",
+        "corpus_name": "test-corpus",
+    }
+    with patch.object(VectaraClient, "check"):
+        client = VectaraClient(config)
+    client.corpus_id = 1
+    client.QUERY_PAGE_SIZE = PAGE_SIZE
+    return client
+
+
+def mock_query_pages(client: VectaraClient, pages: List[Mapping[str, Any]]) -> MagicMock:
+    """Mock `_request` so that each query returns the page at its `start` offset, and deletes succeed."""
+
+    def request(endpoint: str, data: Mapping[str, Any], **kwargs):
+        if endpoint == "query":
+            return {"responseSet": [pages[data["query"][0]["start"] // PAGE_SIZE]]}
+        return {}
+
+    client._request = MagicMock(side_effect=request)  # type: ignore
+    return client._request
+
+
+def page(num_sections: int, document_ids: List[str]) -> Mapping[str, Any]:
+    return {
+        "response": [{"text": "section"}] * num_sections,
+        "document": [{"id": document_id} for document_id in document_ids],
+    }
+
+
+def query_offsets(request: MagicMock) -> List[int]:
+    return [call.kwargs["data"]["query"][0]["start"] for call in request.call_args_list if call.kwargs["endpoint"] == "query"]
+
+
+def deleted_ids(request: MagicMock) -> List[str]:
+    return [call.kwargs["data"]["documentId"] for call in request.call_args_list if call.kwargs["endpoint"] == "delete-doc"]
+
+
+def test_delete_doc_by_metadata_reads_pages_until_short_page(client: VectaraClient):
+    request = mock_query_pages(client, [page(2, ["a", "b"]), page(2, ["c", "d"]), page(1, ["e"])])
+
+    client.delete_doc_by_metadata(metadata_field_name="_ab_stream", metadata_field_values=["stream"])
+
+    assert query_offsets(request) == [0, 2, 4]
+    assert sorted(deleted_ids(request)) == ["a", "b", "c", "d", "e"]
+
+
+def test_delete_doc_by_metadata_pages_on_section_count(client: VectaraClient):
+    # A full page of sections can belong to a single document, which must not end the paging.
+    request = mock_query_pages(client, [page(2, ["a"]), page(0, [])])
+
+    client.delete_doc_by_metadata(metadata_field_name="_ab_stream", metadata_field_values=["stream"])
+
+    assert query_offsets(request) == [0, 2]
+    assert deleted_ids(request) == ["a"]
+
+
+def test_delete_doc_by_metadata_deduplicates_ids_across_pages(client: VectaraClient):
+    # A document with sections on several pages is returned on each of them.
+    request = mock_query_pages(client, [page(2, ["a", "b"]), page(1, ["b"])])
+
+    client.delete_doc_by_metadata(metadata_field_name="_ab_stream", metadata_field_values=["stream"])
+
+    assert sorted(deleted_ids(request)) == ["a", "b"]
+
+
+def test_delete_docs_by_id_is_sequential_unless_parallelized(client: VectaraClient):
+    client.parallelize = False
+    request = mock_query_pages(client, [])
+
+    with patch("destination_vectara.client.ThreadPoolExecutor") as executor:
+        client.delete_docs_by_id(document_ids=["a", "b"])
+
+    executor.assert_not_called()
+    assert deleted_ids(request) == ["a", "b"]
+
+
+def test_delete_docs_by_id_uses_thread_pool_when_parallelized(client: VectaraClient):
+    client.parallelize = True
+    request = mock_query_pages(client, [])
+
+    with patch("destination_vectara.client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+        client.delete_docs_by_id(document_ids=["a", "b"])
+
+    executor.assert_called_once_with(max_workers=client.MAX_PARALLEL_DELETES)
+    assert sorted(deleted_ids(request)) == ["a", "b"]
+
+
+@pytest.fixture(name="token_request")
+def token_request_fixture(client: VectaraClient):
+    """Mock the token endpoint with tokens valid for 300 seconds, and the Vectara session."""
+    client.jwt_token = "token-0"
+    client._jwt_token_refresh_at = 1000.0
+    client._session = MagicMock()
+    client._session.request.return_value.json.return_value = {}
+    with patch("destination_vectara.client.requests.request") as token_request:
+        token_request.return_value.json.side_effect = lambda: {
+            "access_token": f"token-{token_request.call_count}",
+            "expires_in": 300,
+        }
+        yield token_request
+
+
+def sent_tokens(client: VectaraClient) -> List[str]:
+    return [call.kwargs["headers"]["Authorization"] for call in client._session.request.call_args_list]
+
+
+def test_jwt_token_is_not_renewed_before_refresh_point(client: VectaraClient, token_request: MagicMock):
+    with patch("destination_vectara.client.time.monotonic", return_value=999.0):
+        client._request(endpoint="query", data={})
+
+    token_request.assert_not_called()
+    assert sent_tokens(client) == ["Bearer token-0"]
+
+
+def test_jwt_token_is_renewed_once_past_refresh_point(client: VectaraClient, token_request: MagicMock):
+    with patch("destination_vectara.client.time.monotonic", return_value=1000.0):
+        client._request(endpoint="query", data={})
+        client._request(endpoint="query", data={})
+
+    token_request.assert_called_once()
+    assert client._jwt_token_refresh_at == 1000.0 + 300 - client.JWT_TOKEN_REFRESH_MARGIN_SECONDS
+    assert sent_tokens(client) == ["Bearer token-1", "Bearer token-1"]
+
+
+class BarrierLock:
+    """A lock which is only acquired once all parties are waiting for it."""
+
+    def __init__(self, parties: int):
+        self._lock = threading.Lock()
+        self._barrier = threading.Barrier(parties)
+
+    def __enter__(self):
+        self._barrier.wait(timeout=5)
+        self._lock.acquire()
+
+    def __exit__(self, *args):
+        self._lock.release()
+
+
+def test_concurrent_requests_renew_jwt_token_once(client: VectaraClient, token_request: MagicMock):
+    num_requests = 8
+    # Every request sees the expired token before any of them renews it.
+    client._jwt_token_lock = BarrierLock(num_requests)
+
+    with patch("destination_vectara.client.time.monotonic", return_value=1000.0):
+        with ThreadPoolExecutor(max_workers=num_requests) as executor:
+            list(executor.map(lambda _: client._request(endpoint="query", data={}), range(num_requests)))
+
+    token_request.assert_called_once()
+    assert sent_tokens(client) == ["Bearer token-1"] * num_requests
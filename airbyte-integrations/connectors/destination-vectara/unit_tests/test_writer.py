@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+from airbyte_cdk.models import AirbyteRecordMessage, ConfiguredAirbyteCatalog
+from destination_vectara.writer import VectaraWriter
+
+
+def get_catalog() -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog.parse_obj(
+        {
+            "streams": [
+                {
+                    "stream": {
+                        "name": "mystream",
+                        "json_schema": {"type": "object", "properties": {"text": {"type": "string"}}},
+                        "supported_sync_modes": ["full_refresh"],
+                    },
+                    "sync_mode": "full_refresh",
+                    "destination_sync_mode": "append",
+                }
+            ]
+        }
+    )
+
+
+def get_writer(client: MagicMock) -> VectaraWriter:
+    return VectaraWriter(client=client, text_fields=["text"], title_field=None, metadata_fields=None, catalog=get_catalog())
+
+
+def get_record(text: str) -> AirbyteRecordMessage:
+    return AirbyteRecordMessage(stream="mystream", data={"text": text}, emitted_at=0)
+
+
+def test_writers_do_not_share_write_buffer():
+    writer_1 = get_writer(MagicMock())
+    writer_2 = get_writer(MagicMock())
+
+    writer_1.queue_write_operation(get_record("a"))
+
+    assert len(writer_1.write_buffer) == 1
+    assert writer_2.write_buffer == []
+
+
+def test_flush_without_queued_documents_makes_no_client_calls():
+    client = MagicMock()
+    writer = get_writer(client)
+
+    writer.flush()
+
+    assert client.mock_calls == []
+
+
+def test_flush_interval_triggers_single_index_call():
+    client = MagicMock()
+    indexed_documents = []
+    # The writer clears its buffer after the call, so the documents are copied when they are indexed.
+    client.index_documents.side_effect = lambda documents: indexed_documents.extend(documents)
+    writer = get_writer(client)
+    writer.flush_interval = 3
+
+    for text in ["a", "b", "c"]:
+        writer.queue_write_operation(get_record(text))
+
+    client.index_documents.assert_called_once()
+    assert [document[0] for document in indexed_documents] == [{"text": "a"}, {"text": "b"}, {"text": "c"}]
+    assert writer.write_buffer == []
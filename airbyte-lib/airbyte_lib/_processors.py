@@ -13,8 +13,11 @@ from __future__ import annotations
 import abc
 import contextlib
 import io
+import os
 import sys
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any, cast, final
 
 import pyarrow as pa
@@ -47,6 +50,14 @@ if TYPE_CHECKING:
 DEFAULT_BATCH_SIZE = 10_000
 DEBUG_MODE = False  # Set to True to enable additional debug logging.
 
+MAX_FINALIZE_WORKERS = 8
+"""The maximum number of streams to finalize at once, for processors which support it.
+
+SQLAlchemy's default pool keeps 5 connections and opens up to 10 overflow connections on demand.
+With 8 workers, some of them use overflow connections, but they stay within the 15 connection limit
+and so never have to wait on each other for a connection.
+"""
+
 
 class BatchHandle:
     pass
@@ -61,6 +72,7 @@ class RecordProcessor(abc.ABC):
 
     config_class: type[CacheConfigBase]
     skip_finalize_step: bool = False
+    supports_parallel_finalize: bool = False  # If true, streams are finalized concurrently.
     _expected_streams: set[str]
 
     def __init__(
@@ -92,6 +104,9 @@ class RecordProcessor(abc.ABC):
             list[AirbyteStateMessage],
         ] = defaultdict(list, {})
 
+        # Guards batch bookkeeping while streams are finalized in parallel.
+        self._finalize_lock = threading.Lock()
+
         self._catalog_manager: CatalogManager | None = catalog_manager
         self._setup()
 
@@ -220,9 +235,42 @@ class RecordProcessor(abc.ABC):
             progress.log_batch_written(stream_name, len(stream_batch))
 
         # Finalize any pending batches
-        for stream_name in list(self._pending_batches.keys()):
-            self._finalize_batches(stream_name, write_strategy=write_strategy)
-            progress.log_stream_finalized(stream_name)
+        self._finalize_all_streams(write_strategy=write_strategy)
+
+    def _can_finalize_in_parallel(self) -> bool:
+        """Return True if streams can be finalized concurrently."""
+        return self.supports_parallel_finalize
+
+    @final
+    def _finalize_all_streams(
+        self,
+        write_strategy: WriteStrategy,
+    ) -> None:
+        """Finalize the pending batches of all streams.
+
+        Streams are independent of each other, so processors which support it finalize them in a
+        thread pool. Otherwise, streams are finalized one at a time.
+        """
+        stream_names = list(self._pending_batches.keys())
+        max_workers = min(len(stream_names), 2 * (os.cpu_count() or 1), MAX_FINALIZE_WORKERS)
+        if not self._can_finalize_in_parallel() or max_workers <= 1:
+            for stream_name in stream_names:
+                self._finalize_batches(stream_name, write_strategy=write_strategy)
+                progress.log_stream_finalized(stream_name)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._finalize_batches,
+                    stream_name,
+                    write_strategy=write_strategy,
+                ): stream_name
+                for stream_name in stream_names
+            }
+            for future in as_completed(futures):
+                future.result()  # Re-raise any exception from the worker thread.
+                progress.log_stream_finalized(futures[future])
 
     @final
     def _process_batch(
@@ -333,18 +381,22 @@ class RecordProcessor(abc.ABC):
 
         Returns a mapping of batch IDs to batch handles, for those processed batches.
         """
-        batches_to_finalize = self._pending_batches[stream_name].copy()
-        state_messages_to_finalize = self._pending_state_messages[stream_name].copy()
-        self._pending_batches[stream_name].clear()
-        self._pending_state_messages[stream_name].clear()
+        with self._finalize_lock:
+            batches_to_finalize = self._pending_batches[stream_name].copy()
+            state_messages_to_finalize = self._pending_state_messages[stream_name].copy()
+            self._pending_batches[stream_name].clear()
+            self._pending_state_messages[stream_name].clear()
+
+            progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
 
-        progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
         yield batches_to_finalize
         self._finalize_state_messages(stream_name, state_messages_to_finalize)
-        progress.log_batches_finalized(stream_name, len(batches_to_finalize))
 
-        self._finalized_batches[stream_name].update(batches_to_finalize)
-        self._finalized_state_messages[stream_name] += state_messages_to_finalize
+        with self._finalize_lock:
+            progress.log_batches_finalized(stream_name, len(batches_to_finalize))
+
+            self._finalized_batches[stream_name].update(batches_to_finalize)
+            self._finalized_state_messages[stream_name] += state_messages_to_finalize
 
         for batch_id, batch_handle in batches_to_finalize.items():
             self._cleanup_batch(stream_name, batch_id, batch_handle)
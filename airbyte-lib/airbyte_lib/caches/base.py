@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import abc
 import enum
+import json
 from contextlib import contextmanager
 from functools import cached_property
 from typing import TYPE_CHECKING, cast, final
@@ -59,6 +60,12 @@ if TYPE_CHECKING:
 
 DEBUG_MODE = False  # Set to True to enable additional debug logging.
 
+FILE_LOAD_BATCH_SIZE = 50_000
+"""The number of rows to read from a file at a time when loading it into a table."""
+
+READ_BATCH_SIZE = 50_000
+"""The number of rows to read from a table at a time when reading it into pandas or Arrow."""
+
 
 class RecordDedupeMode(enum.Enum):
     APPEND = "append"
@@ -115,6 +122,7 @@ class SQLCacheBase(RecordProcessor):
     file_writer_class: type[FileWriterBase]
 
     supports_merge_insert = False
+    supports_parallel_finalize = True
     use_singleton_connection = False  # If true, the same connection is used for all operations.
 
     # Constructor:
@@ -139,6 +147,8 @@ class SQLCacheBase(RecordProcessor):
         )
         self.type_converter = self.type_converter_class()
         self._cached_table_definitions: dict[str, sqlalchemy.Table] = {}
+        self._cached_column_definitions: dict[str, dict[str, sqlalchemy.types.TypeEngine]] = {}
+        self._known_tables: set[str] = set()
 
     def __getitem__(self, stream: str) -> DatasetBase:
         return self.streams[stream]
@@ -163,7 +173,11 @@ class SQLCacheBase(RecordProcessor):
 
     @final
     def get_sql_engine(self) -> Engine:
-        """Return a new SQL engine to use."""
+        """Return the SQL engine to use.
+
+        The engine is created on first use and then reused, so that all operations share the same
+        connection pool.
+        """
         if self._engine:
             return self._engine
 
@@ -292,10 +306,50 @@ class SQLCacheBase(RecordProcessor):
         self,
         stream_name: str,
     ) -> pd.DataFrame:
-        """Return a Pandas data frame with the stream's data."""
-        table_name = self.get_sql_table_name(stream_name)
-        engine = self.get_sql_engine()
-        return pd.read_sql_table(table_name, engine)
+        """Return a Pandas data frame with the stream's data.
+
+        Columns are backed by Arrow arrays, which are more compact than NumPy objects, especially
+        for strings. Their types are mapped from the table's column types, so they don't depend on
+        the rows in the table. Decimal columns are returned as floats. JSON columns keep the object
+        dtype and hold the parsed values.
+        """
+        schema = pa.schema(
+            [
+                # Match `pd.read_sql`, which coerces decimals to floats.
+                pa.field(field.name, pa.float64()) if pa.types.is_decimal(field.type) else field
+                for field in self._get_arrow_schema(stream_name)
+            ]
+        )
+        data_frame = pd.concat(
+            self._read_stream_data_frames(stream_name, schema=schema),
+            ignore_index=True,
+        )
+        for column_name, column_type in self._get_sql_column_types(stream_name).items():
+            if isinstance(column_type, sqlalchemy.types.JSON):
+                json_texts = data_frame[column_name]
+                data_frame[column_name] = pd.Series(
+                    [None if pd.isna(value) else json.loads(value) for value in json_texts],
+                    dtype=object,
+                )
+
+        return data_frame
+
+    def get_arrow_table(
+        self,
+        stream_name: str,
+    ) -> pa.Table:
+        """Return an Arrow table with the stream's data.
+
+        The table's schema is mapped from the table's column types. JSON columns are returned as
+        strings of JSON text.
+        """
+        schema = self._get_arrow_schema(stream_name)
+        return pa.concat_tables(
+            [
+                pa.Table.from_pandas(data_frame, schema=schema, preserve_index=False)
+                for data_frame in self._read_stream_data_frames(stream_name, schema=schema)
+            ]
+        )
 
     # Protected members (non-public interface):
 
@@ -464,14 +518,15 @@ class SQLCacheBase(RecordProcessor):
         )
         """
         _ = self._execute_sql(cmd)
+        self._known_tables.add(table_name)
         if DEBUG_MODE:
             tables_list = self._get_tables_list()
             assert (
                 table_name in tables_list
             ), f"Table {table_name} was not created. Found: {tables_list}"
 
+    @staticmethod
     def _normalize_column_name(
-        self,
         raw_name: str,
     ) -> str:
         return raw_name.lower().replace(" ", "_").replace("-", "_")
@@ -482,12 +537,82 @@ class SQLCacheBase(RecordProcessor):
     ) -> str:
         return raw_name.lower().replace(" ", "_").replace("-", "_")
 
+    def _get_sql_column_types(
+        self,
+        stream_name: str,
+    ) -> dict[str, sqlalchemy.types.TypeEngine]:
+        """Return the SQL type of each of the stream table's columns.
+
+        Types are reflected from the table. Types which the dialect doesn't recognize fall back to
+        the column definitions derived from the stream's JSON schema.
+        """
+        column_definitions = self._get_sql_column_definitions(stream_name)
+        return {
+            column.name: (
+                column_definitions.get(column.name, column.type)
+                if isinstance(column.type, sqlalchemy.types.NullType)
+                else column.type
+            )
+            for column in self.get_sql_table(stream_name).columns
+        }
+
+    def _get_arrow_schema(
+        self,
+        stream_name: str,
+    ) -> pa.Schema:
+        """Return the Arrow schema of the stream's table."""
+        return pa.schema(
+            [
+                pa.field(column_name, self.type_converter.to_arrow_type(column_type))
+                for column_name, column_type in self._get_sql_column_types(stream_name).items()
+            ]
+        )
+
+    def _read_stream_data_frames(
+        self,
+        stream_name: str,
+        schema: pa.Schema,
+    ) -> Iterator[pd.DataFrame]:
+        """Read the stream's table in chunks of Arrow-backed data frames.
+
+        Each column is cast to its type in the given schema. Decimals are read as text, so that
+        the cast is exact. JSON columns are selected as JSON text, since database drivers differ in
+        whether they parse JSON values or not.
+        """
+        table = self.get_sql_table(stream_name)
+        column_types = self._get_sql_column_types(stream_name)
+        statement = select(
+            *[
+                sqlalchemy.cast(column, sqlalchemy.types.VARCHAR).label(column.name)
+                if isinstance(column_types[column.name], sqlalchemy.types.JSON)
+                else column
+                for column in table.columns
+            ]
+        )
+        dtypes = {field.name: pd.ArrowDtype(field.type) for field in schema}
+        with self.get_sql_connection() as conn:
+            for data_frame in pd.read_sql_query(
+                statement,
+                conn,
+                coerce_float=False,
+                chunksize=READ_BATCH_SIZE,
+                dtype_backend="pyarrow",
+            ):
+                yield data_frame.astype(dtypes)
+
     @final
     def _get_sql_column_definitions(
         self,
         stream_name: str,
     ) -> dict[str, sqlalchemy.types.TypeEngine]:
-        """Return the column definitions for the given stream."""
+        """Return the column definitions for the given stream.
+
+        The definitions are derived from the stream's JSON schema once, and then cached until a
+        source is registered again.
+        """
+        if stream_name in self._cached_column_definitions:
+            return self._cached_column_definitions[stream_name]
+
         columns: dict[str, sqlalchemy.types.TypeEngine] = {}
         properties = self._get_stream_json_schema(stream_name)["properties"]
         for property_name, json_schema_property_def in properties.items():
@@ -499,6 +624,7 @@ class SQLCacheBase(RecordProcessor):
         # TODO: Add the metadata columns (this breaks tests)
         # columns["_airbyte_extracted_at"] = sqlalchemy.TIMESTAMP()
         # columns["_airbyte_loaded_at"] = sqlalchemy.TIMESTAMP()
+        self._cached_column_definitions[stream_name] = columns
         return columns
 
     @overrides
@@ -528,6 +654,15 @@ class SQLCacheBase(RecordProcessor):
         """
         self.file_writer.cleanup_batch(stream_name, batch_id, batch_handle)
 
+    @overrides
+    def _can_finalize_in_parallel(self) -> bool:
+        """Return True if streams can be finalized concurrently.
+
+        Each worker thread needs its own connection, so streams are finalized one at a time when
+        the same connection is used for all operations.
+        """
+        return self.supports_parallel_finalize and not self.use_singleton_connection
+
     @final
     @overrides
     def _finalize_batches(
@@ -568,6 +703,17 @@ class SQLCacheBase(RecordProcessor):
                 raise_on_error=True,
             )
 
+            write_strategy = self._resolve_write_strategy(stream_name, write_strategy)
+            if write_strategy == WriteStrategy.APPEND:
+                # Appending needs no server-side merge, so we load the files straight into the
+                # final table rather than copying them over from a temp table.
+                self._write_files_to_table(
+                    files=files,
+                    stream_name=stream_name,
+                    table_name=final_table_name,
+                )
+                return batches_to_finalize
+
             temp_table_name = self._write_files_to_new_table(
                 files=files,
                 stream_name=stream_name,
@@ -646,7 +792,10 @@ class SQLCacheBase(RecordProcessor):
         """Drop the given table."""
         exists_str = "IF EXISTS" if if_exists else ""
         self._execute_sql(f"DROP TABLE {exists_str} {self._fully_qualified(table_name)}")
+        self._cached_table_definitions.pop(table_name, None)
+        self._known_tables.discard(table_name)
 
+    @final
     def _write_files_to_new_table(
         self,
         files: list[Path],
@@ -655,43 +804,83 @@ class SQLCacheBase(RecordProcessor):
     ) -> str:
         """Write a file(s) to a new table.
 
+        Returns the name of the new table. The files are loaded with `_write_files_to_table()`.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        self._write_files_to_table(
+            files=files,
+            stream_name=stream_name,
+            table_name=temp_table_name,
+        )
+        return temp_table_name
+
+    def _write_files_to_table(
+        self,
+        files: list[Path],
+        stream_name: str,
+        table_name: str,
+    ) -> None:
+        """Write a file(s) to an existing table, which has the stream's columns.
+
         This is a generic implementation, which can be overridden by subclasses
         to improve performance.
         """
-        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        # The inserts below expect the table to exist, so fail early with a clear error if not.
+        if not self._table_exists(table_name):
+            raise exc.AirbyteLibInternalError(
+                message="Table does not exist.",
+                context={
+                    "table_name": table_name,
+                },
+            )
+
+        sql_column_definitions = self._get_sql_column_definitions(stream_name)
+        table = Table(
+            table_name,
+            sqlalchemy.MetaData(schema=self.config.schema_name),
+            *[Column(name, sql_type) for name, sql_type in sql_column_definitions.items()],
+        )
+        with self.get_sql_connection() as conn:
+            # Rows go straight from Arrow to the driver's `executemany()`, without a pandas
+            # intermediate.
+            for batch in self._read_files_in_batches(files):
+                columns = [
+                    (name, column.to_pylist())
+                    for name, column in zip(batch.column_names, batch.columns)
+                    if name in sql_column_definitions
+                ]
+                if not columns or batch.num_rows == 0:
+                    continue
+
+                names = [name for name, _ in columns]
+                rows = [
+                    dict(zip(names, values)) for values in zip(*[values for _, values in columns])
+                ]
+                conn.execute(insert(table), rows)
+
+    @final
+    def _read_files_in_batches(
+        self,
+        files: list[Path],
+    ) -> Iterator[pa.Table]:
+        """Yield the records of the given parquet files, in slices of `FILE_LOAD_BATCH_SIZE` rows.
+
+        Reading in slices means that large files never need to fit in memory at once. Column names
+        are normalized once per file, and the columns are relabeled without copying their data.
+        """
         for file_path in files:
             with pa.parquet.ParquetFile(file_path) as pf:
-                record_batch = pf.read()
-                dataframe = record_batch.to_pandas()
-
-                # Pandas will auto-create the table if it doesn't exist, which we don't want.
-                if not self._table_exists(temp_table_name):
-                    raise exc.AirbyteLibInternalError(
-                        message="Table does not exist after creation.",
-                        context={
-                            "temp_table_name": temp_table_name,
-                        },
-                    )
-
-                dataframe.to_sql(
-                    temp_table_name,
-                    self.get_sql_alchemy_url(),
-                    schema=self.config.schema_name,
-                    if_exists="append",
-                    index=False,
-                    dtype=self._get_sql_column_definitions(stream_name),
-                )
-        return temp_table_name
+                column_names = [self._normalize_column_name(name) for name in pf.schema_arrow.names]
+                for record_batch in pf.iter_batches(batch_size=FILE_LOAD_BATCH_SIZE):
+                    yield pa.table(record_batch.columns, names=column_names)
 
     @final
-    def _write_temp_table_to_final_table(
+    def _resolve_write_strategy(
         self,
         stream_name: str,
-        temp_table_name: str,
-        final_table_name: str,
         write_strategy: WriteStrategy,
-    ) -> None:
-        """Write the temp table into the final table using the provided write strategy."""
+    ) -> WriteStrategy:
+        """Return the write strategy to use for the stream, resolving `AUTO` if needed."""
         has_pks: bool = bool(self._get_primary_keys(stream_name))
         has_incremental_key: bool = bool(self._get_incremental_key(stream_name))
         if write_strategy == WriteStrategy.MERGE and not has_pks:
@@ -704,11 +893,23 @@ class SQLCacheBase(RecordProcessor):
 
         if write_strategy == WriteStrategy.AUTO:
             if has_pks:
-                write_strategy = WriteStrategy.MERGE
-            elif has_incremental_key:
-                write_strategy = WriteStrategy.APPEND
-            else:
-                write_strategy = WriteStrategy.REPLACE
+                return WriteStrategy.MERGE
+            if has_incremental_key:
+                return WriteStrategy.APPEND
+            return WriteStrategy.REPLACE
+
+        return write_strategy
+
+    @final
+    def _write_temp_table_to_final_table(
+        self,
+        stream_name: str,
+        temp_table_name: str,
+        final_table_name: str,
+        write_strategy: WriteStrategy,
+    ) -> None:
+        """Write the temp table into the final table using the provided write strategy."""
+        write_strategy = self._resolve_write_strategy(stream_name, write_strategy)
 
         if write_strategy == WriteStrategy.REPLACE:
             self._swap_temp_table_with_final_table(
@@ -817,6 +1018,9 @@ class SQLCacheBase(RecordProcessor):
             ]
         )
         self._execute_sql(commands)
+        self._cached_table_definitions.pop(final_table_name, None)
+        self._cached_table_definitions.pop(temp_table_name, None)
+        self._known_tables.discard(temp_table_name)
 
     def _merge_temp_table_to_final_table(
         self,
@@ -833,8 +1037,8 @@ class SQLCacheBase(RecordProcessor):
         columns = {self._quote_identifier(c) for c in self._get_sql_column_definitions(stream_name)}
         pk_columns = {self._quote_identifier(c) for c in self._get_primary_keys(stream_name)}
         non_pk_columns = columns - pk_columns
-        join_clause = "{nl} AND ".join(f"tmp.{pk_col} = final.{pk_col}" for pk_col in pk_columns)
-        set_clause = "{nl}    ".join(f"{col} = tmp.{col}" for col in non_pk_columns)
+        join_clause = f"{nl} AND ".join(f"tmp.{pk_col} = final.{pk_col}" for pk_col in pk_columns)
+        set_clause = f",{nl}    ".join(f"{col} = tmp.{col}" for col in non_pk_columns)
         self._execute_sql(
             f"""
             MERGE INTO {self._fully_qualified(final_table_name)} final
@@ -921,7 +1125,7 @@ class SQLCacheBase(RecordProcessor):
 
         # Select records from temp_table that are not in final_table
         select_new_records_stmt = (
-            select([temp_table]).select_from(joined_table).where(where_not_exists_clause)
+            select(temp_table).select_from(joined_table).where(where_not_exists_clause)
         )
 
         # Craft the INSERT statement using the select statement
@@ -942,8 +1146,23 @@ class SQLCacheBase(RecordProcessor):
         self,
         table_name: str,
     ) -> bool:
-        """Return true if the given table exists."""
-        return table_name in self._get_tables_list()
+        """Return true if the given table exists.
+
+        Tables which are known to exist, because we created or found them before, are remembered
+        so that we don't need to query the database again. Only tables that we drop or rename are
+        forgotten.
+        """
+        if table_name in self._known_tables:
+            return True
+
+        with self.get_sql_connection() as conn:
+            inspector: Inspector = sqlalchemy.inspect(conn)
+            exists = inspector.has_table(table_name, schema=self.config.schema_name)
+
+        if exists:
+            self._known_tables.add(table_name)
+
+        return exists
 
     @overrides
     def register_source(
@@ -961,6 +1180,8 @@ class SQLCacheBase(RecordProcessor):
         """
         self._source_name = source_name
         self._ensure_schema_exists()
+        # The incoming catalog may change stream schemas, so column definitions are re-derived.
+        self._cached_column_definitions.clear()
         super().register_source(
             source_name,
             incoming_source_catalog,
@@ -64,6 +64,9 @@ class DuckDBCacheBase(SQLCacheBase):
 
     config_class = DuckDBCacheConfig
     supports_merge_insert = False
+    # DuckDB already parallelizes each statement internally, and separate connections to an
+    # in-memory database would each see a different database.
+    supports_parallel_finalize = False
 
     @overrides
     def get_telemetry_info(self) -> CacheTelemetryInfo:
@@ -162,25 +165,20 @@ class DuckDBCache(DuckDBCacheBase):
 
         return True
 
-    def _write_files_to_new_table(
+    def _write_files_to_table(
         self,
         files: list[Path],
         stream_name: str,
-        batch_id: str,
-    ) -> str:
-        """Write a file(s) to a new table.
+        table_name: str,
+    ) -> None:
+        """Write a file(s) to an existing table.
 
         We use DuckDB's `read_parquet` function to efficiently read the files and insert
         them into the table in a single operation.
 
-        Note: This implementation is fragile in regards to column ordering. However, since
-        we are inserting into a temp table we have just created, there should be no
-        drift between the table schema and the file schema.
+        Columns are inserted and selected by name, so the table may be either a temp table we
+        have just created or the stream's final table.
         """
-        temp_table_name = self._create_table_for_loading(
-            stream_name=stream_name,
-            batch_id=batch_id,
-        )
         columns_list = [
             self._quote_identifier(c)
             for c in list(self._get_sql_column_definitions(stream_name).keys())
@@ -189,7 +187,7 @@ class DuckDBCache(DuckDBCacheBase):
         files_list = ", ".join([f"'{f!s}'" for f in files])
         insert_statement = dedent(
             f"""
-            INSERT INTO {self.config.schema_name}.{temp_table_name}
+            INSERT INTO {self.config.schema_name}.{table_name}
             (
                 {columns_list_str}
             )
@@ -202,4 +200,3 @@ class DuckDBCache(DuckDBCacheBase):
             """
         )
         self._execute_sql(insert_statement)
-        return temp_table_name
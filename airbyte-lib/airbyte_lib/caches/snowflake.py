@@ -96,18 +96,18 @@ class SnowflakeSQLCache(SQLCacheBase):
     type_converter_class = SnowflakeTypeConverter
 
     @overrides
-    def _write_files_to_new_table(
+    def _write_files_to_table(
         self,
         files: list[Path],
         stream_name: str,
-        batch_id: str,
-    ) -> str:
-        """Write files to a new table."""
-        temp_table_name = self._create_table_for_loading(
-            stream_name=stream_name,
-            batch_id=batch_id,
-        )
-        internal_sf_stage_name = f"@%{temp_table_name}"
+        table_name: str,
+    ) -> None:
+        """Write files to an existing table.
+
+        The files are staged in the table's internal stage and purged once loaded, so that they
+        don't accumulate when loading straight into a final table.
+        """
+        internal_sf_stage_name = f"@%{table_name}"
         put_files_statements = "\n".join(
             [
                 f"PUT 'file://{file_path.absolute()!s}' {internal_sf_stage_name};"
@@ -125,7 +125,7 @@ class SnowflakeSQLCache(SQLCacheBase):
         variant_cols_str: str = ("\n" + " " * 21 + ", ").join([f"$1:{col}" for col in columns_list])
         copy_statement = dedent(
             f"""
-            COPY INTO {temp_table_name}
+            COPY INTO {table_name}
             (
                 {columns_list_str}
             )
@@ -135,11 +135,11 @@ class SnowflakeSQLCache(SQLCacheBase):
             )
             FILES = ( {files_list} )
             FILE_FORMAT = ( TYPE = PARQUET )
+            PURGE = TRUE
             ;
             """
         )
         self._execute_sql(copy_statement)
-        return temp_table_name
 
     @overrides
     def _init_connection_settings(self, connection: Connection) -> None:
@@ -152,11 +152,13 @@ class SnowflakeSQLCache(SQLCacheBase):
         This also sets MULTI_STATEMENT_COUNT to 0, which allows multi-statement commands.
         """
         connection.execute(
-            """
-            ALTER SESSION SET
-            QUOTED_IDENTIFIERS_IGNORE_CASE = TRUE
-            MULTI_STATEMENT_COUNT = 0
-            """
+            sqlalchemy.text(
+                """
+                ALTER SESSION SET
+                QUOTED_IDENTIFIERS_IGNORE_CASE = TRUE
+                MULTI_STATEMENT_COUNT = 0
+                """
+            )
         )
 
     @overrides
@@ -20,6 +20,10 @@ if TYPE_CHECKING:
     from airbyte_lib.caches import SQLCacheBase
 
 
+STREAM_RESULTS_BATCH_SIZE = 1000
+"""The number of rows to fetch at a time when iterating over a dataset."""
+
+
 class SQLDataset(DatasetBase):
     """A dataset that is loaded incrementally from a SQL query.
 
@@ -45,7 +49,10 @@ class SQLDataset(DatasetBase):
 
     def __iter__(self) -> Iterator[Mapping[str, Any]]:
         with self._cache.get_sql_connection() as conn:
-            for row in conn.execute(self._query_statement):
+            # Stream the rows with a server-side cursor (where the driver supports one) instead of
+            # buffering the full result set in memory before the first row is returned.
+            result = conn.execute(self._query_statement.execution_options(stream_results=True))
+            for row in result.yield_per(STREAM_RESULTS_BATCH_SIZE):
                 # Access to private member required because SQLAlchemy doesn't expose a public API.
                 # https://pydoc.dev/sqlalchemy/latest/sqlalchemy.engine.row.RowMapping.html
                 yield cast(Mapping[str, Any], row._mapping)  # noqa: SLF001
@@ -56,7 +63,7 @@ class SQLDataset(DatasetBase):
         This method caches the length of the dataset after the first call.
         """
         if self._length is None:
-            count_query = select([func.count()]).select_from(self._query_statement.alias())
+            count_query = select(func.count()).select_from(self._query_statement.alias())
             with self._cache.get_sql_connection() as conn:
                 self._length = conn.execute(count_query).scalar()
 
@@ -5,10 +5,15 @@ from __future__ import annotations
 
 from typing import cast
 
+import pyarrow as pa
 import sqlalchemy
 from rich import print
 
 
+MAX_ARROW_DECIMAL_PRECISION = 38
+"""Decimals with a higher precision are converted to floats in Arrow."""
+
+
 # Compare to documentation here: https://docs.airbyte.com/understanding-airbyte/supported-data-types
 CONVERSION_MAP = {
     "string": sqlalchemy.types.VARCHAR,
@@ -125,3 +130,42 @@ class SQLTypeConverter:
             return self.get_failover_type()
 
         return self.get_failover_type()
+
+    @staticmethod
+    def to_arrow_type(  # noqa: PLR0911  # Too many return statements
+        sql_type: sqlalchemy.types.TypeEngine,
+    ) -> pa.DataType:
+        """Convert a SQL type to an Arrow type.
+
+        JSON values are represented as JSON text. Decimals without a fixed precision and scale are
+        converted to floats.
+        """
+        if isinstance(sql_type, sqlalchemy.types.JSON):
+            return pa.string()
+
+        if isinstance(sql_type, sqlalchemy.types.Boolean):
+            return pa.bool_()
+
+        if isinstance(sql_type, sqlalchemy.types.Integer):
+            return pa.int64()
+
+        if isinstance(sql_type, sqlalchemy.types.Float):
+            return pa.float64()
+
+        if isinstance(sql_type, sqlalchemy.types.Numeric):
+            precision, scale = sql_type.precision, sql_type.scale
+            if precision and scale is not None and precision <= MAX_ARROW_DECIMAL_PRECISION:
+                return pa.decimal128(precision, scale)
+
+            return pa.float64()
+
+        if isinstance(sql_type, sqlalchemy.types.DateTime):
+            return pa.timestamp("us", tz="UTC" if sql_type.timezone else None)
+
+        if isinstance(sql_type, sqlalchemy.types.Date):
+            return pa.date32()
+
+        if isinstance(sql_type, sqlalchemy.types.Time):
+            return pa.time64("us")
+
+        return pa.string()
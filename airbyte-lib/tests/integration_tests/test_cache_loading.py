@@ -0,0 +1,319 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+"""Integration tests which load records straight into caches, without running a connector.
+
+Records are passed to the cache as Airbyte messages, so each test can choose the exact values
+(and edge cases) that go through the file writer and the cache's bulk load path.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+import sqlalchemy
+
+from airbyte_protocol.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    ConfiguredAirbyteCatalog,
+    Type,
+)
+
+from airbyte_lib._file_writers import ParquetWriter
+from airbyte_lib.caches import DuckDBCache, DuckDBCacheConfig, PostgresCache, PostgresCacheConfig
+from airbyte_lib.caches.base import SQLCacheBase
+from airbyte_lib.caches.duckdb import DuckDBCacheBase
+from airbyte_lib.strategies import WriteStrategy
+from airbyte_lib.telemetry import CacheTelemetryInfo
+
+
+STREAM_NAME = "things"
+
+STREAM_PROPERTIES = {
+    "id": {"type": "integer"},
+    "name": {"type": ["null", "string"]},
+    "amount": {"type": ["null", "number"]},
+    "address": {"type": ["null", "object"]},
+    "tags": {"type": ["null", "array"]},
+    "always_null": {"type": ["null", "string"]},
+}
+
+
+def get_catalog(properties: dict[str, Any] = STREAM_PROPERTIES) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog.parse_obj(
+        {
+            "streams": [
+                {
+                    "stream": {
+                        "name": STREAM_NAME,
+                        "supported_sync_modes": ["full_refresh"],
+                        "json_schema": {"type": "object", "properties": properties},
+                    },
+                    "sync_mode": "full_refresh",
+                    "destination_sync_mode": "append",
+                }
+            ]
+        }
+    )
+
+
+def load_records(
+    cache: SQLCacheBase,
+    records: list[dict[str, Any]],
+    write_strategy: WriteStrategy = WriteStrategy.APPEND,
+) -> None:
+    """Load the given records into the cache, as if they had been read from a source."""
+    cache.register_source("source-test", get_catalog(), {STREAM_NAME})
+    cache.process_airbyte_messages(
+        (
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(stream=STREAM_NAME, data=record, emitted_at=0),
+            )
+            for record in records
+        ),
+        write_strategy=write_strategy,
+    )
+
+
+def select_rows(cache: SQLCacheBase) -> list[dict[str, Any]]:
+    """Return the rows of the stream's table, as returned by the database driver."""
+    table = cache.get_sql_table(STREAM_NAME)
+    with cache.get_sql_connection() as conn:
+        result = conn.execute(sqlalchemy.select(table).order_by(table.c.id))
+        return [dict(row._mapping) for row in result]
+
+
+class GenericLoaderDuckDBCache(DuckDBCacheBase):
+    """A DuckDB cache which loads files with the generic `SQLCacheBase` implementation."""
+
+    file_writer_class = ParquetWriter
+
+
+class GenericLoaderPostgresCache(SQLCacheBase):
+    """A Postgres cache which loads files with the generic `SQLCacheBase` implementation."""
+
+    config_class = PostgresCacheConfig
+    file_writer_class = ParquetWriter
+
+    def get_telemetry_info(self) -> CacheTelemetryInfo:
+        return CacheTelemetryInfo("postgres")
+
+
+@pytest.fixture
+def postgres_cache(
+    new_pg_cache_config: PostgresCacheConfig,
+    tmp_path: Path,
+) -> PostgresCache:
+    new_pg_cache_config.cache_dir = tmp_path
+    return PostgresCache(config=new_pg_cache_config)
+
+
+def test_postgres_copy_keeps_empty_strings_and_nulls_apart(postgres_cache: PostgresCache) -> None:
+    load_records(
+        postgres_cache,
+        [
+            {"id": 1, "name": ""},
+            {"id": 2, "name": None},
+            {"id": 3, "name": 'quote " comma , newline \n end'},
+        ],
+    )
+    assert [row["name"] for row in select_rows(postgres_cache)] == [
+        "",
+        None,
+        'quote " comma , newline \n end',
+    ]
+
+
+def test_postgres_copy_encodes_json_columns(postgres_cache: PostgresCache) -> None:
+    load_records(
+        postgres_cache,
+        [
+            # Backed by nested Arrow types (struct and list).
+            {"id": 1, "address": {"city": "Bowling Green"}, "tags": ["a", "b"]},
+            {"id": 2, "address": None, "tags": []},
+        ],
+    )
+    rows = select_rows(postgres_cache)
+    assert [row["address"] for row in rows] == [{"city": "Bowling Green"}, None]
+    assert [row["tags"] for row in rows] == [["a", "b"], []]
+
+
+def test_postgres_copy_encodes_string_values_in_json_columns(
+    postgres_cache: PostgresCache,
+) -> None:
+    # Backed by a string Arrow type, even though the column is JSON.
+    load_records(
+        postgres_cache,
+        [
+            {"id": 1, "address": "Bowling Green"},
+            {"id": 2, "address": None},
+        ],
+    )
+    assert [row["address"] for row in select_rows(postgres_cache)] == ["Bowling Green", None]
+
+
+def test_postgres_copy_loads_all_null_columns(postgres_cache: PostgresCache) -> None:
+    load_records(
+        postgres_cache,
+        [
+            {"id": 1, "always_null": None, "address": None},
+            {"id": 2, "always_null": None, "address": None},
+        ],
+    )
+    rows = select_rows(postgres_cache)
+    assert [row["id"] for row in rows] == [1, 2]
+    assert all(row["always_null"] is None and row["address"] is None for row in rows)
+
+
+@pytest.fixture(params=["duckdb", "postgres"])
+def cache(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> SQLCacheBase:
+    if request.param == "duckdb":
+        return DuckDBCache(
+            config=DuckDBCacheConfig(db_path=tmp_path / "cache.duckdb", cache_dir=tmp_path),
+        )
+
+    return request.getfixturevalue("postgres_cache")
+
+
+@pytest.fixture(params=["duckdb", "postgres"])
+def generic_loader_cache(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> SQLCacheBase:
+    if request.param == "duckdb":
+        return GenericLoaderDuckDBCache(
+            config=DuckDBCacheConfig(db_path=tmp_path / "cache.duckdb", cache_dir=tmp_path),
+        )
+
+    config: PostgresCacheConfig = request.getfixturevalue("new_pg_cache_config")
+    config.cache_dir = tmp_path
+    return GenericLoaderPostgresCache(config=config)
+
+
+def test_generic_loader(generic_loader_cache: SQLCacheBase) -> None:
+    assert type(generic_loader_cache)._write_files_to_table is SQLCacheBase._write_files_to_table
+
+    load_records(
+        generic_loader_cache,
+        [
+            {"id": 1, "name": "", "address": {"city": "Bowling Green"}, "tags": ["a"]},
+            {"id": 2, "name": None, "address": None, "tags": None},
+        ],
+    )
+    rows = select_rows(generic_loader_cache)
+    assert [row["id"] for row in rows] == [1, 2]
+    assert [row["name"] for row in rows] == ["", None]
+    assert [row["always_null"] for row in rows] == [None, None]
+    # DuckDB returns JSON columns as text, while psycopg2 parses them.
+    assert [
+        json.loads(row["address"]) if isinstance(row["address"], str) else row["address"]
+        for row in rows
+    ] == [{"city": "Bowling Green"}, None]
+
+
+def test_append_loads_into_final_table(
+    cache: SQLCacheBase,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_on_new_table(*args: Any, **kwargs: Any) -> str:
+        raise AssertionError("APPEND should not load files into a temp table.")
+
+    monkeypatch.setattr(cache, "_write_files_to_new_table", fail_on_new_table)
+    records = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    load_records(cache, records, write_strategy=WriteStrategy.APPEND)
+    assert len(select_rows(cache)) == len(records)
+
+    load_records(cache, records, write_strategy=WriteStrategy.APPEND)
+    assert [row["id"] for row in select_rows(cache)] == [1, 1, 2, 2]
+
+    tables = cache._get_tables_list()
+    assert cache.get_sql_table_name(STREAM_NAME) in tables
+    # Temp tables are named after the stream and batch ID, without the table prefix.
+    assert not [table for table in tables if table.startswith(f"{STREAM_NAME}_")]
+
+
+def test_json_columns_round_trip_to_pandas_and_arrow(cache: SQLCacheBase) -> None:
+    addresses = [{"city": "Bowling Green", "zip": "42101"}, None]
+    tags = [["a", "b"], None]
+    load_records(
+        cache,
+        [
+            {"id": 1, "name": "a", "address": addresses[0], "tags": tags[0]},
+            {"id": 2, "name": None, "address": addresses[1], "tags": tags[1]},
+        ],
+    )
+
+    df = cache.streams[STREAM_NAME].to_pandas().sort_values("id")
+    assert df["address"].dtype == object
+    assert df["address"].tolist() == addresses
+    assert df["tags"].tolist() == tags
+    # Other columns are still backed by Arrow arrays.
+    assert df["name"].dtype == pd.ArrowDtype(pa.string())
+    assert df["name"].isna().tolist() == [False, True]
+
+    table = cache.get_arrow_table(STREAM_NAME).sort_by("id")
+    assert table.schema.field("address").type == pa.string()
+    assert [
+        None if value is None else json.loads(value) for value in table["address"].to_pylist()
+    ] == addresses
+    assert [
+        None if value is None else json.loads(value) for value in table["tags"].to_pylist()
+    ] == tags
+
+
+def test_read_types_do_not_depend_on_rows(cache: SQLCacheBase) -> None:
+    load_records(
+        cache,
+        [
+            {"id": 1, "name": "a", "amount": 1.5, "address": {"city": "Bowling Green"}},
+            {"id": 2, "name": None, "amount": 12.125, "address": None},
+        ],
+    )
+    # DuckDB stores decimals as DECIMAL(18, 3). Postgres NUMERIC has no fixed precision and scale,
+    # so it is read as floats.
+    amount_type = pa.decimal128(18, 3) if isinstance(cache, DuckDBCacheBase) else pa.float64()
+    expected_schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("name", pa.string()),
+            ("amount", amount_type),
+            ("address", pa.string()),
+            ("tags", pa.string()),
+            ("always_null", pa.string()),
+        ]
+    )
+    expected_dtypes = {
+        "id": pd.ArrowDtype(pa.int64()),
+        "name": pd.ArrowDtype(pa.string()),
+        # Data frames have float columns for decimals, like `pd.read_sql`.
+        "amount": pd.ArrowDtype(pa.float64()),
+        "address": object,
+        "tags": object,
+        "always_null": pd.ArrowDtype(pa.string()),
+    }
+
+    table = cache.get_arrow_table(STREAM_NAME)
+    assert table.schema.remove_metadata() == expected_schema
+    assert sorted(table["amount"].to_pylist()) == [1.5, 12.125]
+    assert sorted(cache.get_pandas_dataframe(STREAM_NAME)["amount"].tolist()) == [1.5, 12.125]
+    assert cache.get_pandas_dataframe(STREAM_NAME).dtypes.to_dict() == expected_dtypes
+
+    sql_table = cache.get_sql_table(STREAM_NAME)
+    with cache.get_sql_connection() as conn:
+        conn.execute(sql_table.delete())
+
+    empty_table = cache.get_arrow_table(STREAM_NAME)
+    assert empty_table.num_rows == 0
+    assert empty_table.schema.remove_metadata() == expected_schema
+    empty_df = cache.get_pandas_dataframe(STREAM_NAME)
+    assert empty_df.empty
+    assert empty_df.dtypes.to_dict() == expected_dtypes
@@ -6,7 +6,7 @@ import pytest
 
 from airbyte_lib._file_writers import ParquetWriterConfig
 from airbyte_lib.caches.base import SQLCacheBase, SQLCacheConfigBase
-from airbyte_lib.caches.duckdb import DuckDBCacheBase, DuckDBCacheConfig
+from airbyte_lib.caches.duckdb import DuckDBCache, DuckDBCacheBase, DuckDBCacheConfig
 
 
 def test_duck_db_cache_config_initialization():
@@ -58,3 +58,43 @@ def test_duck_db_cache_config_inheritance_from_sql_cache_config_base():
 
 def test_duck_db_cache_config_inheritance_from_parquet_writer_config():
     assert issubclass(DuckDBCacheConfig, ParquetWriterConfig)
+
+def test_table_exists_forgets_dropped_tables(tmp_path):
+    cache = DuckDBCache(config=DuckDBCacheConfig(db_path=tmp_path / 'test.duckdb'))
+    cache._create_table('my_table', '"id" BIGINT')
+    assert 'my_table' in cache._known_tables
+    assert cache._table_exists('my_table')
+
+    cache._drop_temp_table('my_table')
+    assert 'my_table' not in cache._known_tables
+    assert not cache._table_exists('my_table')
+
+def test_table_exists_forgets_swapped_temp_tables(tmp_path):
+    cache = DuckDBCache(config=DuckDBCacheConfig(db_path=tmp_path / 'test.duckdb'))
+    cache._create_table('my_stream', '"id" BIGINT')
+    cache._create_table('my_stream_temp', '"id" BIGINT')
+
+    cache._swap_temp_table_with_final_table(
+        stream_name='my_stream',
+        temp_table_name='my_stream_temp',
+        final_table_name='my_stream',
+    )
+    assert 'my_stream_temp' not in cache._known_tables
+    assert not cache._table_exists('my_stream_temp')
+    assert cache._table_exists('my_stream')
+    assert not cache._table_exists('my_stream_deleteme')
+
+class ParallelFinalizeDuckDBCache(DuckDBCache):
+    supports_parallel_finalize = True
+
+class SingletonConnectionDuckDBCache(ParallelFinalizeDuckDBCache):
+    use_singleton_connection = True
+
+def test_singleton_connection_disables_parallel_finalize():
+    # Only the class settings matter, so the caches are not connected.
+    def new_cache(cache_class: type[SQLCacheBase]) -> SQLCacheBase:
+        return cache_class.__new__(cache_class)
+
+    assert new_cache(ParallelFinalizeDuckDBCache)._can_finalize_in_parallel()
+    assert not new_cache(SingletonConnectionDuckDBCache)._can_finalize_in_parallel()
+    assert not new_cache(DuckDBCache)._can_finalize_in_parallel()
@@ -0,0 +1,71 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from airbyte_lib._processors import RecordProcessor
+from airbyte_lib.config import CacheConfigBase
+from airbyte_lib.strategies import WriteStrategy
+
+
+class ParallelStubProcessor(RecordProcessor):
+    """A processor which records the streams it finalizes, optionally failing for one of them."""
+
+    config_class = CacheConfigBase
+    supports_parallel_finalize = True
+
+    def __init__(self, failing_stream: str | None = None) -> None:
+        super().__init__(config=None)
+        self.failing_stream = failing_stream
+        self.finalized_streams: list[str] = []
+        self.finalize_threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _write_batch(self, stream_name, batch_id, record_batch):
+        raise NotImplementedError
+
+    def _finalize_state_messages(self, stream_name, state_messages):
+        pass
+
+    def _finalize_batches(self, stream_name, write_strategy):
+        with self._finalizing_batches(stream_name) as batches_to_finalize:
+            if stream_name == self.failing_stream:
+                raise ValueError(f"Failed to finalize {stream_name}")
+
+            with self._lock:
+                self.finalized_streams.append(stream_name)
+                self.finalize_threads.add(threading.get_ident())
+            return batches_to_finalize
+
+
+def add_pending_batches(processor: RecordProcessor, stream_names: list[str]) -> None:
+    for stream_name in stream_names:
+        processor._pending_batches[stream_name]["batch_id"] = f"{stream_name}_batch"
+
+
+def test_parallel_finalize_finalizes_every_stream():
+    stream_names = [f"stream{i}" for i in range(10)]
+    processor = ParallelStubProcessor()
+    add_pending_batches(processor, stream_names)
+
+    processor._finalize_all_streams(write_strategy=WriteStrategy.AUTO)
+
+    assert sorted(processor.finalized_streams) == sorted(stream_names)
+    assert threading.get_ident() not in processor.finalize_threads
+    for stream_name in stream_names:
+        assert not processor._pending_batches[stream_name]
+        assert processor._finalized_batches[stream_name] == {"batch_id": f"{stream_name}_batch"}
+
+
+def test_parallel_finalize_reraises_worker_exceptions():
+    stream_names = [f"stream{i}" for i in range(4)]
+    processor = ParallelStubProcessor(failing_stream="stream2")
+    add_pending_batches(processor, stream_names)
+
+    with pytest.raises(ValueError, match="Failed to finalize stream2"):
+        processor._finalize_all_streams(write_strategy=WriteStrategy.AUTO)
+
+    assert "stream2" not in processor.finalized_streams
@@ -1,5 +1,6 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import pyarrow as pa
 import pytest
 from sqlalchemy import types
 from airbyte_lib.types import SQLTypeConverter, _get_airbyte_type
@@ -80,3 +81,25 @@ def test_to_airbyte_subtype(
     airbyte_type, subtype = _get_airbyte_type(json_schema_property_def)
     assert airbyte_type == expected_airbyte_type
     assert subtype == expected_airbyte_subtype
+
+
+@pytest.mark.parametrize(
+    "sql_type, expected_arrow_type",
+    [
+        (types.VARCHAR(), pa.string()),
+        (types.JSON(), pa.string()),
+        (types.BOOLEAN(), pa.bool_()),
+        (types.BIGINT(), pa.int64()),
+        (types.FLOAT(), pa.float64()),
+        (types.DECIMAL(), pa.float64()),
+        (types.DECIMAL(18, 3), pa.decimal128(18, 3)),
+        (types.DECIMAL(40, 3), pa.float64()),
+        (types.TIMESTAMP(), pa.timestamp("us")),
+        (types.TIMESTAMP(timezone=True), pa.timestamp("us", tz="UTC")),
+        (types.DATE(), pa.date32()),
+        (types.TIME(), pa.time64("us")),
+        (types.NullType(), pa.string()),
+    ],
+)
+def test_to_arrow_type(sql_type, expected_arrow_type):
+    assert SQLTypeConverter.to_arrow_type(sql_type) == expected_arrow_type